@@ -77,8 +77,8 @@ def create_tf_dataset(X, Y, batch_size, test_size=0.3):
   """
   AUTOTUNE = tf.data.experimental.AUTOTUNE
   
-  X = X.astype('float32')
-  Y = Y.astype('float32')
+  X = X.astype('float32', copy=False)
+  Y = Y.astype('float32', copy=False)
   
   x_tr, x_ts, y_tr, y_ts = train_test_split(X, Y, test_size = 0.3, random_state=42, stratify=Y, shuffle=True)
   
@@ -1,6 +1,8 @@
+from functools import lru_cache
+
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.signal import butter, lfilter, filtfilt, freqz
+from scipy.signal import butter, sosfilt, sosfiltfilt, freqz
 
 def lpf(order = 4, fs = 4, cutoff = 1):
     """Get a low pass filter.
@@ -32,14 +34,49 @@ def hpf(order = 1, fs = 4, cutoff = 0.05):
     b, a = butter(order, high, btype='highpass')
     return b, a
 
+@lru_cache(maxsize=None)
+def lpf_sos(order = 4, fs = 4, cutoff = 1):
+    """Get a low pass filter as second-order sections.
+
+    order: Order for the Butterworth filter
+    fs: Sampling frequency
+    cutoff: Cut off frequency
+
+    Returns second-order sections of IIR filter. The design is cached per
+    (order, fs, cutoff); do not modify the returned array in place.
+
+    """
+    nyq = 0.5 * fs
+    normal_cutoff = cutoff / nyq
+    sos = butter(order, normal_cutoff, btype='lowpass', analog=False, output='sos')
+    return sos
+
+@lru_cache(maxsize=None)
+def hpf_sos(order = 1, fs = 4, cutoff = 0.05):
+    """Get a high pass filter as second-order sections.
+
+    order: Order for the Butterworth filter
+    fs: Sampling frequency
+    cutoff: Cut off frequency
+
+    Returns second-order sections of IIR filter. The design is cached per
+    (order, fs, cutoff); do not modify the returned array in place.
+
+    """
+    nyq = 0.5 * fs
+    high = cutoff / nyq
+    sos = butter(order, high, btype='highpass', output='sos')
+    return sos
+
 
-def butter_lowpassfilter(data, cutoff, sample_rate, order=2):
+def butter_lowpassfilter(data, cutoff, sample_rate, order=2, axis=-1):
   '''Standard Butterworth lowpass filter for 1d-data
 	
     Parameters
     ----------
-	data : 1-d array
-        array containing the data
+	data : array
+        array containing the data. Equal length segments stacked as a
+        2-d array are filtered in a single call.
     cutoff : int or float
         frequency in Hz that acts as cutoff for filter.
     sample_rate : int or float
@@ -48,24 +85,28 @@ def butter_lowpassfilter(data, cutoff, sample_rate, order=2):
         filter order, defines the strength of the roll-off
         around the cutoff frequency.
         default: 2
+    axis : int
+        axis of data along which the filter is applied.
+        default: -1
     
     Returns
     -------
-    y : 1-d array
+    y : array
         filtered data
   '''
-  b, a = lpf(order, sample_rate, cutoff)
-  y = filtfilt(b, a, data)
+  sos = lpf_sos(order, sample_rate, cutoff)
+  y = sosfiltfilt(sos, data, axis=axis)
   return y
 
 
-def butter_highpassfilter(data, cutoff, sample_rate, order=2):
+def butter_highpassfilter(data, cutoff, sample_rate, order=2, axis=-1):
     '''Standard Butterworth highpass filter for 1d-data.
 
     Parameters
     ----------
-    data : 1-d array
-        array containing the data
+    data : array
+        array containing the data. Equal length segments stacked as a
+        2-d array are filtered in a single call.
     cutoff : int or float
         frequency in Hz that acts as cutoff for filter.
     sample_rate : int or float
@@ -74,14 +115,17 @@ def butter_highpassfilter(data, cutoff, sample_rate, order=2):
         filter order, defines the strength of the roll-off
         around the cutoff frequency.
         default: 2
+    axis : int
+        axis of data along which the filter is applied.
+        default: -1
 
     Returns
     -------
-    y : 1-d array
+    y : array
         filtered data
     '''
-    b, a = hpf(order, sample_rate, cutoff)
-    y = lfilter(b, a, data)
+    sos = hpf_sos(order, sample_rate, cutoff)
+    y = sosfilt(sos, data, axis=axis)
     return y
 
 def plot_freq_response(sample_rate, cutoff, order, filter_type='lowpass'):
@@ -33,11 +33,8 @@ class PlotLosses(keras.callbacks.Callback):
             # get the training metric
             tr_value = logs.get(name)
 
-            # get the validation metric
-            try:
-                val_value = logs.get('val_'+name)
-            except:
-                val_value = 0.0
+            # get the validation metric (None when there is no validation set)
+            val_value = logs.get('val_'+name)
 
             # store the metric: for f1-score we get two values one for each class. 
             # We only want the value for the positive class
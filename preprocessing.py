@@ -26,22 +26,25 @@ def resample_data(gsrdata, prevSR, newSR):
   return data
 
 	
-def normalization(gsrdata):
+def normalization(gsrdata, axis=None):
   '''Min Max normalization
     Function to calculate normalized gsr data
 	
     Parameters
     ----------
-    gsrdata : 1-d array
+    gsrdata : array
         array containing the gsr data
+    axis : int or None
+        axis along which to normalize, e.g. 1 to normalize every row of
+        stacked segments independently. None normalizes the whole array.
 		
     Returns
     -------
-    n_gsrdata : 1-d array
+    n_gsrdata : array
         normalized gsr data
   '''
-  gsrdata = gsrdata - (np.min(gsrdata))
-  gsrdata /= (np.max(gsrdata) - np.min(gsrdata))
+  gsrdata = gsrdata - (np.min(gsrdata, axis=axis, keepdims=True))
+  gsrdata /= (np.max(gsrdata, axis=axis, keepdims=True) - np.min(gsrdata, axis=axis, keepdims=True))
   n_gsrdata = gsrdata
   return n_gsrdata
 
@@ -63,8 +66,8 @@ def rolling_mean(data, windowsize, sample_rate):
     rol_mean : 1-d array
         array containing computed rolling mean
   '''
-  avg_hr = (np.mean(data))
-  data_arr = np.array(data)
+  data_arr = np.asarray(data)
+  avg_hr = (np.mean(data_arr))
 	
   t_windowsize = int(windowsize*sample_rate)
   t_shape = data_arr.shape[:-1] + (data_arr.shape[-1] - t_windowsize + 1, t_windowsize)
@@ -72,7 +75,7 @@ def rolling_mean(data, windowsize, sample_rate):
   sep_win = np.lib.stride_tricks.as_strided(data_arr, shape=t_shape, strides=t_strides)
   rol_mean = np.mean(sep_win, axis=1)
 	
-  missing_vals = np.array([avg_hr for i in range(0, int(abs(len(data_arr) - len(rol_mean))/2))])
+  missing_vals = np.full(int(abs(len(data_arr) - len(rol_mean))/2), avg_hr)
   rol_mean = np.insert(rol_mean, 0, missing_vals)
   rol_mean = np.append(rol_mean, missing_vals)
 
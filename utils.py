@@ -44,11 +44,8 @@ class PlotLosses(keras.callbacks.Callback):
             # get the training metric
             tr_value = logs.get(name)
 
-            # get the validation metric
-            try:
-                val_value = logs.get('val_'+name)
-            except:
-                val_value = 0.0
+            # get the validation metric (None when there is no validation set)
+            val_value = logs.get('val_'+name)
 
             # store the metric: for f1-score we get two values one for each class. 
             # We only want the value for the positive class
@@ -577,28 +574,15 @@ def segment_sensor_reading(values, window_duration, overlap_percentage,
     if(total_length < window_length):
         return segments
     
-    start_index = 0
-    end_index = start_index + window_length
     increment_size = int(window_length * (overlap_percentage))
-    
-    while(1):
-        # print(start_index, end_index)
-	
-        # get the segment
-        v = values[start_index:end_index]
 
-        # save the segment
-        segments.append(v)
+    # start index of every window that fits completely inside values
+    start_indices = np.arange(0, total_length - window_length + 1, increment_size)
 
-        # change the start and end index values
-        start_index += increment_size
-        end_index += increment_size 
-
-        if (start_index > total_length) | (end_index > total_length):
-        #print("we are done, no more segments possible")
-            break
-        
-    segments = np.array(segments).reshape(len(segments), window_length)
+    # gather all the windows with a single fancy-indexing call
+    values = np.asarray(values)
+    segments = values[start_indices[:, np.newaxis] + np.arange(window_length)]
+    segments = segments.reshape(len(start_indices), window_length)
     return segments
 
 
@@ -615,8 +599,8 @@ def create_tf_dataset(X, Y, batch_size, test_size=0.3):
   """
   AUTOTUNE = tf.data.experimental.AUTOTUNE
   
-  X = X.astype('float32')
-  Y = Y.astype('float32')
+  X = X.astype('float32', copy=False)
+  Y = Y.astype('float32', copy=False)
   
   x_tr, x_ts, y_tr, y_ts = train_test_split(X, Y, test_size = 0.3, random_state=42, stratify=Y, shuffle=True)
   